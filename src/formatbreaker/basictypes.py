@@ -7,7 +7,14 @@ by only implementing __init__ and _decode, it should not go here.
 
 from __future__ import annotations
 from typing import override, ClassVar, Any
-from formatbreaker.core import Parser, Contexts, Success, ParseResult, get_from_contexts
+from formatbreaker.core import (
+    Parser,
+    Contexts,
+    Success,
+    Reverted,
+    ParseResult,
+    get_from_contexts,
+)
 from formatbreaker.datasource import DataManager, AddrType
 from formatbreaker.exceptions import FBError
 from formatbreaker.util import validate_address_or_length
@@ -43,6 +50,25 @@ class ByteParser(Parser):
         """
         return data.read_bytes(1)
 
+    @override
+    def read_array(
+        self, data: DataManager, contexts: Contexts, reps: int
+    ) -> list[Any] | type[ParseResult]:
+        """Reads `reps` bytes at once and translates them one by one
+
+        Args:
+            data: Data being parsed
+            contexts: Past stored parsing results
+            reps: The number of bytes to read
+
+        Returns:
+            The translated bytes
+        """
+        with data.make_child(relative=True, addr_type=AddrType.PARENT) as new_data:
+            raw = new_data.read_bytes(reps)
+            return [self.translate(raw[i : i + 1]) for i in range(reps)]
+        return Reverted
+
 
 Byte = ByteParser()
 
@@ -50,6 +76,8 @@ Byte = ByteParser()
 class Bytes(Parser):
     """Reads a number of bytes from the data"""
 
+    __slots__ = ("_byte_length",)
+    _byte_length: int | str | tuple
     _default_backup_label: ClassVar[str] = "Bytes"
 
     @override
@@ -76,11 +104,12 @@ class Bytes(Parser):
             addr: The bit or byte address in `data` where the bytes to be parsed lie.
         """
         if isinstance(self._byte_length, int):
-            length = self._byte_length
-        else:
-            length = get_from_contexts(contexts, self._byte_length)
-            if not isinstance(length, int):
-                raise TypeError
+            # Already validated by the constructor
+            return data.read_bytes(self._byte_length)
+
+        length = get_from_contexts(contexts, self._byte_length)
+        if not isinstance(length, int):
+            raise TypeError
         if length < 1:
             raise ValueError
 
@@ -91,6 +120,8 @@ class VarBytes(Parser):
     """Reads a number of bytes from the data with length dynamically
     defined by another field in the data"""
 
+    __slots__ = ("_length_key",)
+    _length_key: str
     _default_backup_label: ClassVar[str] = "VarBytes"
 
     @override
@@ -194,9 +225,7 @@ class RemnantParser(Parser):
         Returns:
             The length of `data`
         """
-        result = data.read_bytes()
-        print(result)
-        return result
+        return data.read_bytes()
 
 
 Remnant = RemnantParser()
@@ -224,6 +253,28 @@ class BitParser(Parser):
         """
         return data.read_bits(1)[0]
 
+    @override
+    def read_array(
+        self, data: DataManager, contexts: Contexts, reps: int
+    ) -> list[Any] | type[ParseResult]:
+        """Reads `reps` bits at once and translates them one by one
+
+        Args:
+            data: Data being parsed
+            contexts: Past stored parsing results
+            reps: The number of bits to read
+
+        Returns:
+            The translated bits
+        """
+        if data.addr_type != AddrType.BIT:
+            # Only a bitwise parent accepts any number of bits back from each read,
+            # so other addressing reads one bit at a time to keep its checks
+            return super().read_array(data, contexts, reps)
+        with data.make_child(relative=True, addr_type=AddrType.PARENT) as new_data:
+            return [self.translate(bit) for bit in new_data.read_bits(reps).to_bools()]
+        return Reverted
+
 
 Bit = BitParser()
 
@@ -231,6 +282,7 @@ Bit = BitParser()
 class BitWord(Parser):
     """Reads a number of bits from the data"""
 
+    __slots__ = ("_bit_length",)
     _bit_length: int
     _default_backup_label: ClassVar[str] = "BitWord"
     _default_addr_type: ClassVar[AddrType] = AddrType.BIT
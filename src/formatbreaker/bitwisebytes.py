@@ -2,13 +2,25 @@
 
 from __future__ import annotations
 from typing import overload
-import operator as op
 import formatbreaker.util as fbu
 
+_BYTE_BOOLS = tuple(
+    tuple(bool(byte & (0x80 >> i)) for i in range(8)) for byte in range(256)
+)
+# The bits of every byte value as booleans, most significant bit first
+
 
 class BitwiseBytes:
     """Allows treating bytes as a subscriptable bit list"""
 
+    __slots__ = (
+        "_data",
+        "_start_bit",
+        "_stop_bit",
+        "_start_byte",
+        "_stop_byte",
+        "_length",
+    )
     _data: bytes
     _start_bit: int
     _stop_bit: int
@@ -41,13 +53,15 @@ class BitwiseBytes:
             raise TypeError
 
         data_length = bitlen(source)
-
-        fbu.validate_address_or_length(start_bit, 0, data_length)
-        if stop_bit is not None:
-            fbu.validate_address_or_length(stop_bit, 0, data_length)
-        else:
+        if stop_bit is None:
             stop_bit = data_length
 
+        # Checked inline, since every read from a DataBuffer constructs one of these
+        if not (isinstance(start_bit, int) and isinstance(stop_bit, int)):
+            raise TypeError
+        if not 0 <= start_bit <= stop_bit <= data_length:
+            raise IndexError
+
         self._length = stop_bit - start_bit
 
         self._start_byte = base_byte + (base_bit + start_bit) // 8
@@ -76,16 +90,23 @@ class BitwiseBytes:
             if step != 1:
                 raise NotImplementedError
 
-            return BitwiseBytes(self._data, start, stop)
+            # Shares the underlying bytes rather than copying them. The bounds come
+            # from slice.indices(), so the constructor's validation is skipped.
+            result = object.__new__(BitwiseBytes)
+            result._data = self._data
+            base_bit = self._start_byte * 8 + self._start_bit
+            result._length = length
+            result._start_byte, result._start_bit = divmod(base_bit + start, 8)
+            result._stop_byte, result._stop_bit = divmod(base_bit + stop, 8)
+            return result
 
         elif isinstance(item, int):  # type: ignore
             if item >= self._length or item < -self._length:
                 raise IndexError
-            item = item % self._length
-            bit_ind = (self._start_bit + item % 8) % 8
-            byte_ind = self._start_byte + (item + self._start_bit) // 8
-
-            bit_raw = (0x80 >> bit_ind) & self._data[byte_ind]
+            bit_addr = self._start_bit + item % self._length
+            bit_raw = (0x80 >> (bit_addr & 7)) & self._data[
+                self._start_byte + (bit_addr >> 3)
+            ]
 
             return bool(bit_raw)
 
@@ -109,44 +130,11 @@ class BitwiseBytes:
         if self._length == 0:
             return b""
 
-        if self._stop_bit == 0:
-            last_byte_addr = self._stop_byte - 1
-        else:
-            last_byte_addr = self._stop_byte
-
-        single_byte = last_byte_addr == self._start_byte
-        multi_byte = last_byte_addr > self._start_byte + 1
-
-        stop_shift = (8 - self._stop_bit) % 8
-
-        if single_byte:
-            result = bytes(
-                [
-                    (self._data[self._start_byte] & (0xFF >> self._start_bit))
-                    >> stop_shift
-                ]
-            )
-        else:
-            first_byte = bytes(
-                [self._data[self._start_byte] & (0xFF >> self._start_bit)]
-            )
-            last_byte = bytes([self._data[last_byte_addr] & (0xFF << stop_shift)])
-            mid_bytes = b""
-            if multi_byte:
-                mid_bytes = self._data[self._start_byte + 1 : last_byte_addr]
-
-            data = first_byte + mid_bytes + last_byte
-
-            if self._stop_bit == 0:
-                result = data
-            else:
-                shift_data = [b << (8 - stop_shift) for b in data]
-
-                first_part = [b & 0xFF for b in shift_data[:-1]]
-                second_part = [b >> 8 for b in shift_data[1:]]
+        if self._start_bit == 0 and self._stop_bit == 0:
+            # Byte aligned, so a single slice suffices
+            return self._data[self._start_byte : self._stop_byte]
 
-                result = bytes(map(op.add, first_part, second_part))
-        return result
+        return int(self).to_bytes(fbu.uptobyte(self._length), "big")
 
     def to_bools(self) -> list[bool]:
         """Converts to a list of booleans
@@ -154,18 +142,66 @@ class BitwiseBytes:
         Returns:
             A list of the boolean values of the bits
         """
-        return [bool(self[i]) for i in range(self._length)]
+        if self._length == 0:
+            return []
+        stop_byte = self._stop_byte + 1 if self._stop_bit else self._stop_byte
+        # Expands whole bytes at a time from a lookup table
+        bools = [
+            bit
+            for byte in self._data[self._start_byte : stop_byte]
+            for bit in _BYTE_BOOLS[byte]
+        ]
+        if self._start_bit == self._stop_bit == 0:
+            return bools
+        return bools[self._start_bit : self._start_bit + self._length]
+
+    def to_packed(self) -> bytes:
+        """Converts to bytes with the bits left justified
+
+        This packs the bits in the same order as `to_bools()`. Unlike `bytes()`, any
+        padding bits are zeros at the end of the last byte.
+
+        Returns:
+            A left justified copy of the contents
+        """
+        if self._length == 0:
+            return b""
+        if self._start_bit == 0 and self._stop_bit == 0:
+            return self._data[self._start_byte : self._stop_byte]
+        return (int(self) << (-self._length % 8)).to_bytes(
+            fbu.uptobyte(self._length), "big"
+        )
 
     def __index__(self) -> int:
         if self._length == 0:
             raise RuntimeError
-        return int.from_bytes(bytes(self), "big", signed=False)
+        stop_byte = self._stop_byte + 1 if self._stop_bit else self._stop_byte
+        raw = int.from_bytes(self._data[self._start_byte : stop_byte], "big")
+        return (raw >> ((8 - self._stop_bit) % 8)) & ((1 << self._length) - 1)
 
     def __eq__(self: BitwiseBytes, other: object) -> bool:
+        if not isinstance(other, BitwiseBytes) or self._length != other._length:
+            return False
+        if self._length == 0:
+            return True
+        if self._start_bit != other._start_bit:
+            return int(self) == int(other)
+
+        # Same bit phase, so whole bytes line up and only the edges need masking
+        extra_byte = 1 if self._stop_bit else 0
+        a = self._data[self._start_byte : self._stop_byte + extra_byte]
+        b = other._data[other._start_byte : other._stop_byte + extra_byte]
+        if self._start_bit == self._stop_bit == 0:
+            return a == b
+
+        head_mask = 0xFF >> self._start_bit
+        tail_mask = (0xFF00 >> self._stop_bit) & 0xFF if self._stop_bit else 0xFF
+        if len(a) == 1:
+            return not (a[0] ^ b[0]) & head_mask & tail_mask
         return (
-            isinstance(other, BitwiseBytes)
-            and (self._length == other._length)
-            and (self._length == 0 or (int(self) == int(other)))
+            not (a[0] ^ b[0]) & head_mask
+            and not (a[-1] ^ b[-1]) & tail_mask
+            and a[1:-1] == b[1:-1]
         )
 
 
@@ -10,6 +10,7 @@ from abc import ABC, abstractmethod
 import copy
 import io
 import collections
+import collections.abc
 from formatbreaker.util import validate_address_or_length
 from formatbreaker.datasource import DataManager, AddrType
 
@@ -18,6 +19,36 @@ class Context(collections.ChainMap[str, Any]):
     """Contains the results from parsing in a nested manner, allowing reverting failed
     optional data reads"""
 
+    _next_suffix: dict[str, int]
+    # For each base key, a suffix number n such that "base 1" through "base n-1" are
+    # all known to be in use. Lets renaming skip straight past earlier duplicates.
+    _removals_seen: int
+    # The value of `_removals` when `_next_suffix` was last known to be valid
+    _removals: ClassVar[int] = 0
+    # Counts keys removed from any Context. Contexts made by new_child(), parents and
+    # copy() share maps, so a removal through one can open a gap below the hints of
+    # another. Removals are rare, so every Context drops its hints after one.
+
+    def __init__(self, *maps: collections.abc.MutableMapping[str, Any]) -> None:
+        super().__init__(*maps)
+        self._next_suffix = {}
+        self._removals_seen = Context._removals
+
+    @override
+    def new_child(self, m: Any = None, **kwargs: Any) -> Context:
+        """Creates a child Context, which inherits the renaming state
+
+        Args:
+            m: The mapping to use for the child, if provided
+
+        Returns:
+            The new child Context
+        """
+        child = super().new_child(m, **kwargs)
+        child._next_suffix = self._next_suffix.copy()
+        child._removals_seen = self._removals_seen
+        return child
+
     def __setitem__(self, key: str, value: Any) -> None:
         """Sets the underlying ChainMap value but renames duplicate keys
 
@@ -25,20 +56,98 @@ class Context(collections.ChainMap[str, Any]):
             key: A string dictionary key
             value: The value to store with the given `key`
         """
-        parts = key.split(" ")
-        if parts[-1].isnumeric():
-            base = " ".join(parts[0:-1])
-            i = int(parts[-1])
+        head, _, suffix = key.rpartition(" ")
+        if suffix.isnumeric():
+            base = head
+            i = int(suffix)
             new_key = base + " " + str(i)
         else:
             base = key
             i = 1
             new_key = key
 
-        while new_key in self:
+        if new_key in self:
+            if self._removals_seen != Context._removals:
+                # Keys were removed since the hints were made, so start over
+                self._next_suffix.clear()
+                self._removals_seen = Context._removals
+            next_suffix = self._next_suffix.get(base, 1)
+            if 1 <= i < next_suffix:
+                i = next_suffix
+            contiguous = i <= next_suffix
             new_key = base + " " + str(i)
-            i = i + 1
-        super().__setitem__(new_key, value)
+            while new_key in self:
+                i = i + 1
+                new_key = base + " " + str(i)
+            if contiguous:
+                self._next_suffix[base] = i + 1
+        self.maps[0][new_key] = value  # Same as ChainMap, without the method call
+
+    @override
+    def __delitem__(self, key: str) -> None:
+        """Removes a key from this Context, but not its parents
+
+        Args:
+            key: The key to remove
+        """
+        super().__delitem__(key)
+        Context._removals += 1
+
+    @override
+    def pop(self, key: str, *args: Any) -> Any:
+        """Removes a key from this Context, but not its parents
+
+        Args:
+            key: The key to remove
+            *args: An optional default value to return if `key` is not found
+
+        Returns:
+            The value stored with `key`, or the default
+        """
+        result = super().pop(key, *args)
+        Context._removals += 1
+        return result
+
+    @override
+    def popitem(self) -> tuple[str, Any]:
+        """Removes a key and value from this Context, but not its parents
+
+        Returns:
+            The removed key and value
+        """
+        result = super().popitem()
+        Context._removals += 1
+        return result
+
+    @override
+    def clear(self) -> None:
+        """Removes the values stored in this Context, but not its parents"""
+        super().clear()
+        Context._removals += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns all of the stored values as a single dictionary
+
+        Returns:
+            A dictionary of all the values, including those from parent Contexts
+        """
+        if len(self.maps) == 1:
+            return dict(self.maps[0])  # Copies without a ChainMap lookup per key
+        return dict(self)
+
+    def take_dict(self) -> dict[str, Any]:
+        """Returns the stored values of a Context with no parents without copying them
+
+        The Context should not be used afterwards, since it shares the dictionary.
+
+        Returns:
+            The dictionary holding the values
+        """
+        if len(self.maps) != 1:
+            raise RuntimeError
+        result = self.maps[0]
+        assert isinstance(result, dict)
+        return result
 
     def update_ext(self) -> None:
         """Loads all of the current Context values into the parent Context"""
@@ -46,6 +155,7 @@ class Context(collections.ChainMap[str, Any]):
             raise RuntimeError
         self.maps[1].update(self.maps[0])
         self.maps[0].clear()
+        # The renaming hints stay valid, since the keys are still in the chain
 
 
 type Contexts = tuple[Context, ...]
@@ -95,6 +205,25 @@ def get_from_contexts(contexts: Contexts, key: str | tuple):
         return result
 
 
+_HEX_STRINGS = tuple(hex(i) for i in range(4096))
+
+
+def _hex(addr: int) -> str:
+    """Converts an address to a hex string for use in labels
+
+    Small addresses are looked up from a precomputed table.
+
+    Args:
+        addr: A bit or byte address
+
+    Returns:
+        The same result as `hex(addr)`
+    """
+    if 0 <= addr < 4096:
+        return _HEX_STRINGS[addr]
+    return hex(addr)
+
+
 def _spacer(
     data: DataManager,
     context: Context,
@@ -114,9 +243,9 @@ def _spacer(
     if length == 0:
         return
     if length > 1:
-        spacer_label = "spacer_" + hex(start_addr) + "-" + hex(stop_addr - 1)
+        spacer_label = f"spacer_{_hex(start_addr)}-{_hex(stop_addr - 1)}"
     else:
-        spacer_label = "spacer_" + hex(start_addr)
+        spacer_label = f"spacer_{_hex(start_addr)}"
 
     context[spacer_label] = data.read(length)
 
@@ -230,12 +359,16 @@ class Parser(ABC):
         Returns:
             An indicator of how the parsing went
         """
-        if self._address is not None:
-            _spacer(data, contexts[0], self._address)
+        # The private attributes are read directly to skip the property calls, since
+        # this runs for every element parsed
+        if self.__address is not None:
+            _spacer(data, contexts[0], self.__address)
         addr = data.address
-        result = self.read_and_translate(data, contexts)
+        # Same as read_and_translate(), inlined to save a call per nesting level
+        result = self.read(data, contexts)
         if result is Reverted:
             return Reverted
+        result = self.translate(result)
         if isinstance(result, Context):
             result.update_ext()
         elif result is None:
@@ -265,7 +398,7 @@ class Parser(ABC):
             addr_type = self._addr_type
         with DataManager(src=data, addr_type=addr_type) as manager:
             self.goto_addr_and_read(manager, (context,))
-            return dict(context)
+            return context.take_dict()
         return {}
 
     @final
@@ -286,12 +419,12 @@ class Parser(ABC):
             data: The data to be stored
             addr: The location the data came from, used for unlabeled fields
         """
-        if self._label:
-            label = self._label
+        if self.__label:
+            label = self.__label
         else:
             label = self._backup_label
             if addr is not None:
-                label = label + "_" + hex(addr)
+                label = f"{label}_{_hex(addr)}"
         context[label] = data
 
     def translate(self, data: Any) -> Any:
@@ -308,6 +441,40 @@ class Parser(ABC):
         """
         return data
 
+    def read_array(
+        self, data: DataManager, contexts: Contexts, reps: int
+    ) -> list[Any] | type[ParseResult]:
+        """Reads and translates data repeatedly into a list
+
+        This is used by `Array`. It may be overridden by subclasses that can read
+        several values at once more efficiently, as long as each value is still
+        passed through `translate`.
+
+        Args:
+            data: The data currently being parsed
+            contexts: Past stored parsing results
+            reps: The number of repetitions
+
+        Returns:
+            A list of the translated results
+        """
+        results: list[Any] = []
+        for _ in range(reps):
+            with data.make_child(
+                relative=True,
+                addr_type=AddrType.PARENT,
+                revertible=False,
+            ) as new_data:
+                out_context = Context()
+                result = self.read_and_translate(new_data, (out_context, *contexts[1:]))
+                if result is Reverted:
+                    results.append([])
+                elif isinstance(result, Context):
+                    results.append(result.to_dict())  # Well, I guess that's okay
+                elif result is not None:
+                    results.append(result)
+        return results
+
     @final
     def __getitem__(self, qty: int):
         """Makes bracket notation create an array of this Parser
@@ -340,8 +507,11 @@ class Parser(ABC):
             addr: The new address
 
         Returns:
-            A copy of this instance with the address set
+            A copy of this instance with the address set, or this instance if the
+            address is already set
         """
+        if addr == self._address:
+            return self  # Parsers aren't modified after creation, so share them
         b = copy.copy(self)
         b._address = addr
         return b
@@ -354,10 +524,13 @@ class Parser(ABC):
             label: The new label
 
         Returns:
-            A copy of this instance with the label set
+            A copy of this instance with the label set, or this instance if the
+            label is already set
         """
         if not isinstance(label, str):
             raise TypeError
+        if label == self._label:
+            return self  # Parsers aren't modified after creation, so share them
         b = copy.copy(self)
         b._label = label
         return b
@@ -366,9 +539,10 @@ class Parser(ABC):
 class MultiElement(Parser):
     """A parser that contains other parsers."""
 
-    __slots__ = ("_relative", "_elements")
+    __slots__ = ("_relative", "_elements", "_readers")
     _relative: bool
     _elements: tuple[Parser, ...]
+    _readers: tuple[Callable[[DataManager, Contexts], type[ParseResult]], ...]
 
     def __init__(
         self,
@@ -392,6 +566,8 @@ class MultiElement(Parser):
 
         self._addr_type = addr_type
         self._elements = elements
+        # Bind the element read methods once, rather than on every parse
+        self._readers = tuple(element.goto_addr_and_read for element in elements)
         self._relative = relative
 
 
@@ -422,9 +598,10 @@ class Block(MultiElement):
             relative=self._relative, addr_type=self._addr_type
         ) as new_data:
             out_context = Context()
-            for element in self._elements:
-                element.goto_addr_and_read(new_data, (out_context, *contexts))
-            return dict(out_context)
+            element_contexts = (out_context, *contexts)
+            for reader in self._readers:
+                reader(new_data, element_contexts)
+            return out_context.take_dict()
         return Reverted
 
 
@@ -485,10 +662,9 @@ class Section(MultiElement):
             revertible=self._optional,
         ) as new_data:
             out_context = contexts[0].new_child()
-            for element in self._elements:
-                element.goto_addr_and_read(new_data, (out_context, *contexts[1:]))
-
-            print(out_context)
+            element_contexts = (out_context, *contexts[1:])
+            for reader in self._readers:
+                reader(new_data, element_contexts)
             return out_context
         return Reverted
 
@@ -595,6 +771,9 @@ class Repeat(Modifier):
             raise ValueError
 
         results = contexts[0].new_child()
+        # update_ext() empties the child after each repetition, so one child is reused
+        # rather than allocating a new one every time
+        out_context = results.new_child()
 
         for _ in range(reps):
             with data.make_child(
@@ -603,7 +782,6 @@ class Repeat(Modifier):
                 revertible=False,
             ) as new_data:
                 addr = new_data.address
-                out_context = results.new_child()
                 result = self._parser.read_and_translate(new_data, contexts)
                 if result is Reverted:
                     continue
@@ -652,24 +830,7 @@ class Array(Modifier):
         if reps < 1:
             raise ValueError
 
-        results: list[Any] = []
-        for _ in range(reps):
-            with data.make_child(
-                relative=True,
-                addr_type=AddrType.PARENT,
-                revertible=False,
-            ) as new_data:
-                out_context = Context()
-                result = self._parser.read_and_translate(
-                    new_data, (out_context, *contexts[1:])
-                )
-                if result is Reverted:
-                    results.append([])
-                elif isinstance(result, Context):
-                    results.append(dict(result))  # Well, I guess that's okay
-                elif result is not None:
-                    results.append(result)
-        return results
+        return self._parser.read_array(data, contexts, reps)
 
 
 class IfValue(Modifier):
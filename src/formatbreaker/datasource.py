@@ -5,6 +5,7 @@ from typing import Any, Optional, Type
 from types import TracebackType
 import io
 import collections
+import itertools
 import bisect
 from enum import Enum
 from formatbreaker.bitwisebytes import BitwiseBytes, bitlen
@@ -23,7 +24,12 @@ class AddrType(Enum):
     PARENT = 4
 
 
-DATA_BUFFER_SIZE = 1024 * 8
+DATA_BUFFER_SIZE = 64 * 1024 * 8
+# The minimum number of bits read from a stream at once. Reads are served from the
+# buffered data, so a larger size means fewer calls to the stream's read()
+
+_EMPTY_BITS = BitwiseBytes(b"")
+# BitwiseBytes instances are never modified, so zero length reads can share one
 
 
 class DataBuffer:
@@ -89,24 +95,57 @@ class DataBuffer:
         Returns:
             A tuple with the bits requested and the address of the end bit (exclusive)
         """
-        if start < self.lower_bound:
+        stop = self._find_stop(start, bit_length)
+        start_bit = start % 8
+        bits = BitwiseBytes(
+            self._bytes_in_range(start, stop), start_bit, start_bit + stop - start
+        )
+        return bits, stop
+
+    def get_bytes(self, start: int, bit_length: int | None = None) -> tuple[bytes, int]:
+        """Generates a single `bytes` of the byte-aligned address range requested
+
+        This avoids constructing a `BitwiseBytes` when the data is already aligned.
+
+        Args:
+            start: Address of the first bit (inclusive), on a byte boundary
+            bit_length: The number of bits to return, a multiple of 8. Defaults to all
+                remaining bits.
+        Returns:
+            A tuple with the bytes requested and the address of the end bit (exclusive)
+        """
+        assert start % 8 == 0
+        assert bit_length is None or bit_length % 8 == 0
+        stop = self._find_stop(start, bit_length)
+        return self._bytes_in_range(start, stop), stop
+
+    def _find_stop(self, start: int, bit_length: int | None) -> int:
+        """Finds the end of a requested address range, loading data as needed
+
+        Args:
+            start: Address of the first bit (inclusive)
+            bit_length: The number of bits requested. Defaults to all remaining bits.
+
+        Returns:
+            The address of the end bit (exclusive)
+        """
+        bounds = self._bounds  # Read directly, this runs on every read
+        if start < bounds[0]:
             raise IndexError("Addressed data no longer in DataBuffer")
         if bit_length is None:
             self._load_from_stream()
-            stop = self.upper_bound
-        else:
-            if bit_length < 0:
-                raise IndexError("Cannot read negative length.")
-            stop = start + bit_length
-            if stop > self.upper_bound:
-                bits_needed = stop - self.upper_bound
-                if self._load_from_stream(bits_needed) < bits_needed:
-                    raise FBNoDataError
-
-        return self._concatenate_bits_in_range(start, stop), stop
-
-    def _concatenate_bits_in_range(self, start: int, stop: int):
-        """Generates a single `BitwiseBytes` of the address range requested
+            return bounds[-1]
+        if bit_length < 0:
+            raise IndexError("Cannot read negative length.")
+        stop = start + bit_length
+        if stop > bounds[-1]:
+            bits_needed = stop - bounds[-1]
+            if self._load_from_stream(bits_needed) < bits_needed:
+                raise FBNoDataError
+        return stop
+
+    def _bytes_in_range(self, start: int, stop: int) -> bytes:
+        """Generates a single `bytes` containing the address range requested
 
         This method relies on the data already existing in `_buffers`
 
@@ -114,47 +153,54 @@ class DataBuffer:
             start: Address of the first bit (inclusive)
             stop: Address of the end bit (exclusive)
 
-        Returns: The bits requested
+        Returns: The bytes containing all the bits requested
         """
-        assert stop > start >= 0
+        assert stop >= start >= 0
 
-        length = stop - start
+        if stop == start:
+            return b""
 
-        start_buffer = bisect.bisect_right(self._bounds, start) - 1
+        bounds = self._bounds
+        buffers = self._buffers
+
+        newest_start = bounds[-2]
+        if start >= newest_start:
+            # Entirely in the newest buffer, which is where most reads land
+            return buffers[-1][
+                downtobyte(start - newest_start) : uptobyte(stop - newest_start)
+            ]
+
+        start_buffer = bisect.bisect_right(bounds, start) - 1
         assert start_buffer >= 0
-        assert start_buffer < len(self._buffers)
+        assert start_buffer < len(buffers)
 
-        stop_buffer = bisect.bisect_left(self._bounds, stop) - 1
+        stop_buffer = bisect.bisect_left(bounds, stop) - 1
         assert start_buffer >= 0
-        assert start_buffer < len(self._buffers)
+        assert start_buffer < len(buffers)
 
-        start_buffer_start_bit = start - self._bounds[start_buffer]
-        stop_buffer_stop_bit = stop - self._bounds[stop_buffer]
+        start_buffer_start_bit = start - bounds[start_buffer]
+        stop_buffer_stop_bit = stop - bounds[stop_buffer]
 
         start_buffer_start_byte = downtobyte(start_buffer_start_bit)
         stop_buffer_stop_byte = uptobyte(stop_buffer_stop_bit)
 
         if start_buffer == stop_buffer:
-            byte_result = self._buffers[start_buffer][
+            byte_result = buffers[start_buffer][
                 start_buffer_start_byte:stop_buffer_stop_byte
             ]
 
-        elif start_buffer + 1 == stop_buffer:
-            byte_result = (
-                self._buffers[start_buffer][start_buffer_start_byte:]
-                + self._buffers[stop_buffer][:stop_buffer_stop_byte]
-            )
         else:
-            byte_result = self._buffers[start_buffer][start_buffer_start_byte:]
-            for i in range(start_buffer + 1, stop_buffer):
-                byte_result = byte_result + self._buffers[i]
-            byte_result = (
-                byte_result + self._buffers[stop_buffer][:stop_buffer_stop_byte]
+            # Join all at once, taking the partial edge buffers through memoryviews so
+            # the result is the only copy made
+            byte_result = b"".join(
+                [
+                    memoryview(buffers[start_buffer])[start_buffer_start_byte:],
+                    *itertools.islice(buffers, start_buffer + 1, stop_buffer),
+                    memoryview(buffers[stop_buffer])[:stop_buffer_stop_byte],
+                ]
             )
 
-        start_slice = start % 8
-        stop_slice = start_slice + length
-        return BitwiseBytes(byte_result, start_slice, stop_slice)
+        return byte_result
 
     def _load_from_stream(self, bit_length: int | None = None) -> int:
         """Reads bytes from the underlying stream into a buffer
@@ -203,9 +249,10 @@ class DataBuffer:
         assert len(self._bounds) > 1
         # This would imply that we have have no buffers
 
-        while len(self._bounds) > 2 and addr >= self._bounds[1]:
-            del self._buffers[0]
-            del self._bounds[0]
+        bounds = self._bounds
+        while len(bounds) > 2 and addr >= bounds[1]:
+            self._buffers.popleft()
+            bounds.popleft()
 
 
 class DataManager:
@@ -243,6 +290,7 @@ class DataManager:
         "_parent",
         "_base",
         "_addr_type",
+        "_unit",
     )
 
     _buffer: DataBuffer
@@ -254,6 +302,7 @@ class DataManager:
     _parent: DataManager | None
     _base: int
     _addr_type: AddrType
+    _unit: int
 
     def __init__(
         self,
@@ -301,6 +350,10 @@ class DataManager:
             if self._addr_type == AddrType.PARENT:
                 self._addr_type = AddrType.BYTE
 
+        # Resolve the addressing type to a bit multiplier once, so reads and address
+        # lookups don't need to branch on the address type
+        self._unit = 8 if self._addr_type == AddrType.BYTE else 1
+
         if self._addr_type == AddrType.BYTE_STRICT:
             if self._cursor % 8:
                 raise FBError("Strict byte addr_type must start on a byte boundary")
@@ -317,9 +370,16 @@ class DataManager:
             according to `self.addr_type`
         """
         self._fail_if_unsafe()
-        if self._addr_type == AddrType.BYTE:
-            return (self._cursor - self._base) // 8
-        return self._cursor - self._base
+        return (self._cursor - self._base) // self._unit
+
+    @property
+    def addr_type(self) -> AddrType:
+        """Returns the addressing type
+
+        Returns:
+            The addressing type, with `AddrType.PARENT` already resolved
+        """
+        return self._addr_type
 
     def make_child(
         self,
@@ -354,9 +414,9 @@ class DataManager:
         """
         self._fail_if_unsafe()
 
-        if self._addr_type == AddrType.BYTE:
-            return self.read_bytes(length)
-        return bytes(self.read_bits(length))
+        if length is None:
+            return self._read_as_bytes()
+        return self._read_as_bytes(length * self._unit)
 
     def read_bytes(self, byte_length: int | None = None) -> bytes:
         """Reads bytes from the buffer
@@ -369,10 +429,31 @@ class DataManager:
         """
         self._fail_if_unsafe()
         if byte_length is None:
-            return bytes(self.read_bits())
-        if byte_length == 0:
+            return self._read_as_bytes()
+        return self._read_as_bytes(byte_length * 8)
+
+    def _read_as_bytes(self, bit_length: int | None = None) -> bytes:
+        """Reads bits from the buffer as right justified bytes
+
+        Byte aligned reads are taken directly from the buffer without constructing
+        an intermediate `BitwiseBytes`.
+
+        Args:
+            bit_length: The number of bits to read. Reads all data available if
+            undefined.
+
+        Returns:
+            The requested data, if available
+        """
+        if bit_length == 0:
             return b""
-        return bytes(self.read_bits(bit_length=byte_length * 8))
+        if self._cursor % 8 or (bit_length is not None and bit_length % 8):
+            return bytes(self.read_bits(bit_length))
+
+        (result, stop_addr) = self._buffer.get_bytes(self._cursor, bit_length)
+        self._cursor = stop_addr
+        self._trim()
+        return result
 
     def read_bits(self, bit_length: int | None = None) -> BitwiseBytes:
         """Reads bits from the buffer
@@ -387,7 +468,7 @@ class DataManager:
         start_addr = self._cursor
 
         if bit_length == 0:
-            return BitwiseBytes(b"")
+            return _EMPTY_BITS
 
         (result, stop_addr) = self._buffer.get_data(start_addr, bit_length)
         self._cursor = stop_addr
@@ -415,10 +496,7 @@ class DataManager:
             # Data has been read successfully and we update the parent AddressManager
             # with the current cursor location before this Cursor is discarded.
             if self._parent is not None:
-                if (
-                    self._parent._addr_type == AddrType.BYTE
-                    and (self._cursor - self._base) % 8
-                ):
+                if self._parent._unit == 8 and (self._cursor - self._base) % 8:
                     raise RuntimeError(
                         "Cannot return non-byte length to bytewise parent"
                     )
@@ -18,6 +18,7 @@ from formatbreaker.bitwisebytes import BitwiseBytes
 class Flag(Modifier):
     """Reads as a boolean"""
 
+    __slots__ = ("_true_value", "_false_value")
     _true_value: Any | None
     _false_value: Any | None
 
@@ -50,7 +51,7 @@ def ByteFlag(true_value: Any = None) -> Parser:  # pylint: disable=invalid-name
     Returns:
         A parser instance
     """
-    if isinstance(true_value, bytes):
+    if true_value is None or isinstance(true_value, bytes):
         return Flag(Byte, b"\0", true_value)
     return Flag(Byte, b"\0", [true_value])
 
@@ -147,6 +148,9 @@ UuidB = Translator(Bytes(16), lambda data: uuid.UUID(bytes=data), "UUID")
 class Const(Modifier):
     """Fails parsing if the contained parser's output is not a fixed value"""
 
+    __slots__ = ("_value",)
+    _value: Any
+
     def __init__(self, value: Any, parser: Parser | None = None) -> None:
         if parser is None:
             if isinstance(value, bool):
@@ -197,6 +201,9 @@ BitZero = Const(False)
 class PascalString(Modifier):
     """A class which represents a PascalString"""
 
+    __slots__ = ("_fmt",)
+    _fmt: str | None
+
     def __init__(self, numberparser: Parser, fmt: str | None) -> None:
         base_parser = Block(numberparser >> "num", Bytes("num") >> "raw_bytes")
         super().__init__(base_parser, "String")
@@ -220,6 +227,9 @@ class PascalString(Modifier):
 class PaddedString(Modifier):
     """A class which represents a padded string"""
 
+    __slots__ = ("_fmt",)
+    _fmt: str | None
+
     def __init__(self, byte_length: int | str | tuple, fmt: str | None) -> None:
         base_parser = Bytes(byte_length)
         super().__init__(base_parser, "String")
@@ -243,6 +253,9 @@ class PaddedString(Modifier):
 
 
 class EnumTranslator(Modifier):
+    __slots__ = ("_fmt",)
+    _fmt: type[Enum]
+
     def __init__(self, parser: Parser, fmt: type[Enum]) -> None:
         super().__init__(parser, "Enum")
         self._fmt = fmt
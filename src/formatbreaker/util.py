@@ -35,7 +35,7 @@ def uptobyte(bits: int) -> int:
     Returns:
         The number of whole bytes needed to contain the `bits`
     """
-    return -(bits // -8)
+    return (bits + 7) >> 3
 
 
 def downtobyte(bits: int) -> int:
@@ -47,4 +47,4 @@ def downtobyte(bits: int) -> int:
     Returns:
         The number of whole bytes included `bits`
     """
-    return bits // 8
+    return bits >> 3
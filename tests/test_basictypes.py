@@ -1,8 +1,8 @@
 # pylint: disable=missing-module-docstring
 # pylint: disable=missing-class-docstring
 # pylint: disable=missing-function-docstring
-# pylint: disable=protected-access
 
+import io
 import pytest
 import formatbreaker.basictypes as bt
 from formatbreaker.decoders import UInt8
@@ -18,25 +18,21 @@ class TestByte:
 
     @pytest.mark.parametrize("bytedata,bytesize", [(b"506", 1)])
     def test_reads_positional_bytes(self, bytedata: bytes, bytesize: int):
-        assert (bt.Byte @ 0 >> "name").parse(bytedata) == {
-            "name": bytes(bytedata[0:bytesize])
-        }
-        assert (bt.Byte @ bytesize >> "name").parse(bytedata)["name"] == bytes(
-            bytedata[bytesize : 2 * bytesize]
-        )
-        assert (bt.Byte @ (2 * bytesize) >> "name").parse(bytedata)["name"] == bytes(
-            bytedata[2 * bytesize : 3 * bytesize]
-        )
-
-        assert (bt.Byte @ 0).parse(bytedata) == {
-            "Byte_0x0": bytes(bytedata[0:bytesize])
-        }
-        assert (bt.Byte @ bytesize).parse(bytedata)["Byte_" + hex(bytesize)] == bytes(
-            bytedata[bytesize : 2 * bytesize]
-        )
+        assert (bt.Byte @ 0 >> "name").parse(bytedata) == {"name": bytedata[0:bytesize]}
+        assert (bt.Byte @ bytesize >> "name").parse(bytedata)["name"] == bytedata[
+            bytesize : 2 * bytesize
+        ]
+        assert (bt.Byte @ (2 * bytesize) >> "name").parse(bytedata)["name"] == bytedata[
+            2 * bytesize : 3 * bytesize
+        ]
+
+        assert (bt.Byte @ 0).parse(bytedata) == {"Byte_0x0": bytedata[0:bytesize]}
+        assert (bt.Byte @ bytesize).parse(bytedata)[
+            "Byte_" + hex(bytesize)
+        ] == bytedata[bytesize : 2 * bytesize]
         assert (bt.Byte @ (2 * bytesize)).parse(bytedata)[
             "Byte_" + hex(bytesize * 2)
-        ] == bytes(bytedata[2 * bytesize : 3 * bytesize])
+        ] == bytedata[2 * bytesize : 3 * bytesize]
 
     def test_addressed_fails_with_no_byte_avail(self):
         with pytest.raises(FBError):
@@ -50,6 +46,27 @@ class TestByte:
         with pytest.raises(FBError):
             assert (bt.Byte @ 3 >> "name").parse(b"505")
 
+    def test_byte_array_reads_single_bytes(self):
+        bk = Section(bt.Byte[3] >> "bytes", bt.Byte >> "next")
+        assert bk.parse(b"abcd") == {"bytes": [b"a", b"b", b"c"], "next": b"d"}
+
+    def test_byte_array_translates_each_byte(self):
+        class ByteValue(bt.ByteParser):
+            def translate(self, data: bytes) -> int:
+                return data[0]
+
+        assert (ByteValue()[3] >> "b").parse(b"\x01\x02\x03") == {"b": [1, 2, 3]}
+
+    def test_repeat_stores_each_repetition(self):
+        bk = Section(bt.Byte >> "x", (bt.Byte >> "x") * 2, bt.Byte * 2)
+        assert bk.parse(b"\x01\x02\x03\x04\x05") == {
+            "x": b"\x01",
+            "x 1": b"\x02",
+            "x 2": b"\x03",
+            "Byte_0x0": b"\x04",
+            "Byte_0x0 1": b"\x05",
+        }
+
 
 class TestBytes:
 
@@ -66,24 +83,22 @@ class TestBytes:
     @pytest.mark.parametrize("bytedata,bytesize", [(b"506", 1)])
     def test_reads_positional_bytes(self, bytedata: bytes, bytesize: int):
         assert (bt.Bytes(1) @ 0 >> "name").parse(bytedata) == {
-            "name": bytes(bytedata[0:bytesize])
+            "name": bytedata[0:bytesize]
         }
-        assert (bt.Bytes(2) @ bytesize >> "name").parse(bytedata)["name"] == bytes(
-            bytedata[bytesize : 3 * bytesize]
-        )
+        assert (bt.Bytes(2) @ bytesize >> "name").parse(bytedata)["name"] == bytedata[
+            bytesize : 3 * bytesize
+        ]
         assert (bt.Bytes(1) @ (2 * bytesize) >> "name").parse(bytedata)[
             "name"
-        ] == bytes(bytedata[2 * bytesize : 3 * bytesize])
+        ] == bytedata[2 * bytesize : 3 * bytesize]
 
-        assert (bt.Bytes(1) @ 0).parse(bytedata) == {
-            "Bytes_0x0": bytes(bytedata[0:bytesize])
-        }
+        assert (bt.Bytes(1) @ 0).parse(bytedata) == {"Bytes_0x0": bytedata[0:bytesize]}
         assert (bt.Bytes(2) @ bytesize).parse(bytedata)[
             "Bytes_" + hex(bytesize)
-        ] == bytes(bytedata[bytesize : 3 * bytesize])
+        ] == bytedata[bytesize : 3 * bytesize]
         assert (bt.Bytes(1) @ (2 * bytesize)).parse(bytedata)[
             "Bytes_" + hex(bytesize * 2)
-        ] == bytes(bytedata[2 * bytesize : 3 * bytesize])
+        ] == bytedata[2 * bytesize : 3 * bytesize]
 
     def test_addressed_fails_with_no_byte_avail(self):
         with pytest.raises(FBError):
@@ -98,27 +113,49 @@ class TestBytes:
             assert (bt.Bytes(1) @ 3 >> "name").parse(b"505")
 
 
+VAR_BYTES_INPUT = b"\xFF" + bytes(range(255))
+
+
+@pytest.fixture(scope="module")
+def var_bytes_section() -> Section:
+    return Section(UInt8 >> "length", bt.VarBytes(source="length"))
+
+
+@pytest.fixture(scope="module")
+def addressed_var_bytes_section() -> Section:
+    return Section(UInt8 >> "length", bt.VarBytes(source="length") @ 5 >> "results")
+
+
+@pytest.fixture(scope="module")
+def bitwise_var_bytes_section() -> Section:
+    return Section(
+        UInt8 >> "length",
+        bt.VarBytes(source="length") @ 12 >> "results",
+        bt.PadToAddress(24),
+        addr_type=AddrType.BIT,
+    )
+
+
 class TestVarBytes:
 
     def test_missing_length_field_raises_error(self):
         with pytest.raises(KeyError):
             bt.VarBytes(source="length").parse(b"abcde")
 
-    @pytest.fixture
-    def test_section(self):
-        return Section(UInt8 >> "length", bt.VarBytes(source="length"))
+    def test_reads_single_byte(self, var_bytes_section: Section):
+        assert var_bytes_section.parse(b"\x015")["VarBytes_0x1"] == b"5"
 
-    def test_reads_single_byte(self, test_section: Section):
-        assert test_section.parse(b"\x015")["VarBytes_0x1"] == b"5"
+    def test_reads_all_byte(self, var_bytes_section: Section):
+        result = var_bytes_section.parse(VAR_BYTES_INPUT)
+        assert result["VarBytes_0x1"] == VAR_BYTES_INPUT[1:]
 
-    def test_reads_all_byte(self, test_section: Section):
-        assert test_section.parse(b"\xFF" + bytes(range(255)))["VarBytes_0x1"] == bytes(
-            range(255)
-        )
+    def test_reads_all_byte_from_stream(self, var_bytes_section: Section):
+        stream = io.BytesIO(VAR_BYTES_INPUT)
+        assert var_bytes_section.parse(stream)["VarBytes_0x1"] == VAR_BYTES_INPUT[1:]
 
-    def test_reads_past_end_raises_error(self, test_section: Section):
+    def test_reads_past_end_raises_error(self, var_bytes_section: Section):
         with pytest.raises(FBError):
-            test_section.parse(b"\x01")
+            var_bytes_section.parse(b"\x01")
 
     def test_invalid_length_key_raises_error(self):
         with pytest.raises(TypeError):
@@ -126,21 +163,8 @@ class TestVarBytes:
         with pytest.raises(TypeError):
             bt.VarBytes(source=None)  # type: ignore
 
-    @pytest.fixture
-    def test_section_address(self):
-        return Section(UInt8 >> "length", bt.VarBytes(source="length") @ 5 >> "results")
-
-    def test_reads_positional_bytes(self, test_section_address: Section):
-        assert test_section_address.parse(b"\x0100005")["results"] == b"5"
-
-    @pytest.fixture
-    def test_section_bitwise(self):
-        return Section(
-            UInt8 >> "length",
-            bt.VarBytes(source="length") @ 12 >> "results",
-            bt.PadToAddress(24),
-            addr_type=AddrType.BIT,
-        )
+    def test_reads_positional_bytes(self, addressed_var_bytes_section: Section):
+        assert addressed_var_bytes_section.parse(b"\x0100005")["results"] == b"5"
 
 
 def test_pad_to_address_bytewise():
@@ -151,15 +175,22 @@ def test_pad_to_address_bytewise():
     assert dict(context) == {"spacer_0x1-0x4": b"2345"}
 
 
+def test_pad_to_address_at_address_is_no_op():
+    with DataManager(b"123456") as data:
+        data.read_bytes(5)
+        context = Context()
+        bt.PadToAddress(5).goto_addr_and_read(data, (context,))
+        assert data.address == 5
+    assert not context
+
+
 def test_pad_to_address_bitwise():
     with DataManager(b"\xF0") as data:
         context = Context()
         with data.make_child(addr_type=AddrType.BIT) as new_data:
             new_data.read(1)
             bt.PadToAddress(5).goto_addr_and_read(new_data, (context,))
-            bt.PadToAddress(8).goto_addr_and_read(
-                new_data, (context,)
-            )  # pylint: disable=protected-access
+            bt.PadToAddress(8).goto_addr_and_read(new_data, (context,))
 
     assert dict(context) == {"spacer_0x1-0x4": b"\x0e", "spacer_0x5-0x7": b"\x00"}
 
@@ -215,6 +246,22 @@ class TestBit:
             ]
         }
 
+    def test_bit_array_advances_address(self):
+        bk = Section(bt.Bit[3] >> "bits", bt.Bit >> "next", addr_type=AddrType.BIT)
+        assert bk.parse(b"\xB0") == {"bits": [True, False, True], "next": True}
+
+    def test_bit_array_translates_each_bit(self):
+        class InvertedBit(bt.BitParser):
+            def translate(self, data: bool) -> bool:
+                return not data
+
+        bk = Section(InvertedBit()[3] >> "bits", addr_type=AddrType.BIT)
+        assert bk.parse(b"\xB0") == {"bits": [False, True, False]}
+
+    def test_bit_array_in_bytewise_parent_raises_error(self):
+        with pytest.raises(RuntimeError, match="non-byte length"):
+            Section(bt.Bit[8]).parse(b"\xB0")
+
 
 class TestBitWord:
     @pytest.mark.parametrize(
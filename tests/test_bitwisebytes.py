@@ -6,42 +6,55 @@
 import pytest
 from formatbreaker.bitwisebytes import BitwiseBytes, bitlen
 
-src_data = bytes(range(256)) * 16
+BYTEDATA = b"\xff\x0f\x00\xff"
+# The bits of BYTEDATA, unpacked most significant bit first
+BYTEDATA_BOOLS = [bool(byte & (0x80 >> i)) for byte in BYTEDATA for i in range(8)]
 
 
-class TestBitwiseBytes:
-    @pytest.fixture
-    def bytedata(self):
-        return b"\xff\x0f\x00\xff"
+@pytest.fixture(scope="module")
+def bytedata():
+    return BYTEDATA
 
-    @pytest.fixture
-    def data(self, bytedata):
-        return BitwiseBytes(bytedata)
 
-    def test_invalid_constructor_inputs_raise_error(self, bytedata):
-        with pytest.raises(TypeError):
-            BitwiseBytes(bytedata, 1, "")  # type: ignore
-        with pytest.raises(IndexError):
-            BitwiseBytes(bytedata, -1, 1)
-        with pytest.raises(IndexError):
-            BitwiseBytes(bytedata, 0, -1)
-        with pytest.raises(IndexError):
-            BitwiseBytes(bytedata, 33, 1)
-        with pytest.raises(IndexError):
-            BitwiseBytes(bytedata, 1, 33)
-        with pytest.raises(TypeError):
-            BitwiseBytes(bytedata, "", 1)  # type: ignore
+@pytest.fixture(scope="module")
+def data(bytedata):
+    return BitwiseBytes(bytedata)  # Never modified, so the tests can share it
+
+
+class TestBitwiseBytes:
+    @pytest.mark.parametrize(
+        "start_bit,stop_bit,error",
+        [
+            (1, "", TypeError),
+            (-1, 1, IndexError),
+            (0, -1, IndexError),
+            (33, 1, IndexError),
+            (1, 33, IndexError),
+            (32, 33, IndexError),
+            (5, 2, IndexError),
+            ("", 1, TypeError),
+        ],
+    )
+    def test_invalid_constructor_inputs_raise_error(
+        self, bytedata, start_bit, stop_bit, error
+    ):
+        with pytest.raises(error):
+            BitwiseBytes(bytedata, start_bit, stop_bit)
+
+    def test_invalid_constructor_source_raises_error(self):
         with pytest.raises(TypeError):
             BitwiseBytes("", 1, 1)  # type: ignore
 
     def test_constructor_stop_bit_logic_ok(self, bytedata):
-        with pytest.raises(IndexError):
-            BitwiseBytes(bytedata, 32, 33)
         assert bytes(BitwiseBytes(bytedata, 32, 32)) == b""
 
     def test_converting_back_to_bytes_is_invariant(self, data, bytedata):
         assert bytes(data) == bytedata
 
+    def test_byte_aligned_slice_converts_to_bytes(self, data, bytedata):
+        assert bytes(data[8:24]) == bytedata[1:3]
+        assert bytes(data[8:16]) == bytedata[1:2]
+
     def test_copy_constructor_is_invariant(self, data):
         copy = BitwiseBytes(data)
         assert copy == data
@@ -57,48 +70,35 @@ class TestBitwiseBytes:
     def test_slices_with_different_contents_are_unequal(self, data):
         assert data[0:9] != data[23:32]
 
+    def test_same_phase_slices_compare_edge_bits(self):
+        a = BitwiseBytes(b"\x0f\x00\xf0")
+        b = BitwiseBytes(b"\xff\x00\xff")
+        assert a[4:20] == b[4:20]
+        assert a[3:20] != b[3:20]
+        assert a[4:21] != b[4:21]
+        assert a[4:6] == b[4:6]
+        assert a[2:6] != b[2:6]
+
     def test_slices_with_different_lengths_are_not_equal(self, data):
         assert int(data[8:12]) == int(data[16:24])
         assert data[8:12] != data[16:24]
 
+    def test_slices_of_slices_are_offset_correctly(self, data):
+        assert data[8:32][8:16] == data[16:24]
+        assert data[4:32][4:12] == data[8:16]
+        assert data[4:32]._data is data._data
+
     def test_slicing_cropped_to_data_range(self, data):
         assert data[-50:200] == data
 
     def test_to_bool_conversion_works(self, data):
-        assert data.to_bools() == [
-            True,
-            True,
-            True,
-            True,
-            True,
-            True,
-            True,
-            True,
-            False,
-            False,
-            False,
-            False,
-            True,
-            True,
-            True,
-            True,
-            False,
-            False,
-            False,
-            False,
-            False,
-            False,
-            False,
-            False,
-            True,
-            True,
-            True,
-            True,
-            True,
-            True,
-            True,
-            True,
-        ]
+        assert data.to_bools() == BYTEDATA_BOOLS
+
+    def test_packed_conversion_left_justifies(self, data):
+        assert data.to_packed() == BYTEDATA
+        assert data[4:12].to_packed() == b"\xf0"
+        assert data[4:14].to_packed() == b"\xf0\xc0"
+        assert data[:0].to_packed() == b""
 
     def test_len_function_works(self, data):
         assert len(data) == 32
@@ -109,6 +109,11 @@ class TestBitwiseBytes:
     def test_int_conversion_works(self, data):
         assert int(data) == 4279173375
 
+    def test_unaligned_conversions_keep_all_bits(self):
+        unaligned = BitwiseBytes(b"\xdc\xe1\x1b", 1, 18)
+        assert int(unaligned) == 0b10111001110000100
+        assert bytes(unaligned) == b"\x01\x73\x84"
+
     def test_int_conversion_on_empty_failse(self):
         empty = BitwiseBytes(b"")
         with pytest.raises(RuntimeError):
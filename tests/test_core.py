@@ -5,7 +5,6 @@
 # pyright: reportPrivateUsage=false
 
 from typing import Any
-import io
 import pytest
 from formatbreaker.basictypes import Failure
 from formatbreaker.core import (
@@ -16,6 +15,7 @@ from formatbreaker.core import (
     Contexts,
     Success,
     _spacer,
+    _hex,
     Optional,
     ParseResult,
 )
@@ -34,6 +34,60 @@ class TestContext:
         assert context["name 1"] == 2
         assert context["name 2"] == 3
 
+    def test_renaming_many_duplicates_and_explicit_suffixes(self):
+        context = Context()
+        context["name 2"] = 0
+        for i in range(1, 5):
+            context["name"] = i
+        assert context["name"] == 1
+        assert context["name 1"] == 2
+        assert context["name 2"] == 0
+        assert context["name 3"] == 3
+        assert context["name 4"] == 4
+        child = context.new_child()
+        child["name"] = 5
+        assert child["name 5"] == 5
+
+    def test_renaming_reuses_deleted_names(self):
+        context = Context()
+        for i in range(3):
+            context["name"] = i
+        del context["name 1"]
+        context["name"] = 3
+        assert context["name 1"] == 3
+        assert context.pop("name 2") == 2
+        child = context.new_child()
+        child["name"] = 4
+        assert child["name 2"] == 4
+
+    def test_renaming_restarts_after_clear(self):
+        context = Context()
+        context["name"] = 1
+        context["name"] = 2
+        context.clear()
+        context["name"] = 3
+        context["name"] = 4
+        assert context == {"name": 3, "name 1": 4}
+
+    def test_child_renaming_restarts_after_parent_clear(self):
+        context = Context()
+        context["name"] = 1
+        context["name"] = 2
+        child = context.new_child()
+        context.clear()
+        child["name"] = 3
+        child["name"] = 4
+        assert child == {"name": 3, "name 1": 4}
+
+    def test_renaming_reuses_names_deleted_through_parents(self):
+        context = Context()
+        for i in range(3):
+            context["name"] = i
+        child = context.new_child()
+        del child.parents["name 1"]
+        child["name"] = 3
+        assert child["name 1"] == 3
+
     def test_update_ext_works(self):
         context = Context()
         context["name"] = 1
@@ -45,6 +99,31 @@ class TestContext:
         assert context["name 1"] == 2
         assert context["new_name"] == 3
 
+    def test_renaming_continues_after_update_ext(self):
+        context = Context()
+        child = context.new_child()
+        for i in range(4):
+            child["name"] = i
+            child.update_ext()
+        child["name 1"] = 4
+        assert context == {"name": 0, "name 1": 1, "name 2": 2, "name 3": 3}
+        assert child["name 4"] == 4
+
+    def test_to_dict_includes_parents(self):
+        context = Context()
+        context["name"] = 1
+        child = context.new_child()
+        child["name"] = 2
+        assert context.to_dict() == {"name": 1}
+        assert child.to_dict() == {"name": 1, "name 1": 2}
+
+    def test_take_dict_returns_stored_values(self):
+        context = Context()
+        context["name"] = 1
+        assert context.take_dict() == {"name": 1}
+        with pytest.raises(RuntimeError):
+            context.new_child().take_dict()
+
     def test_update_ext_with_no_parent_raises_error(self):
         context = Context()
         with pytest.raises(RuntimeError):
@@ -57,19 +136,23 @@ class ConcreteParser(Parser):
         return Success
 
 
-class TestParser:
+@pytest.fixture
+def context():
+    return Context()
 
-    @pytest.fixture
-    def default_dt(self):
-        return ConcreteParser()
 
-    @pytest.fixture
-    def context(self):
-        return Context()
+@pytest.fixture(scope="module")
+def default_dt():
+    return ConcreteParser()
 
-    def test_constructor_defaults_to_no_label_and_address(
-        self, default_dt: Parser
-    ):
+
+@pytest.fixture(scope="module")
+def labeled_dt() -> Parser:
+    return ConcreteParser() @ 3 >> "label"
+
+
+class TestParser:
+    def test_constructor_defaults_to_no_label_and_address(self, default_dt: Parser):
 
         assert default_dt._label is None
         assert default_dt._address is None
@@ -85,10 +168,6 @@ class TestParser:
         with pytest.raises(IndexError):
             _ = ConcreteParser() @ -1 >> "label"
 
-    @pytest.fixture
-    def labeled_dt(self) -> Parser:
-        return ConcreteParser() @ 3 >> "label"
-
     def test_constructor_with_arguments_saves_label_and_address(
         self, labeled_dt: Parser
     ):
@@ -96,55 +175,139 @@ class TestParser:
         assert labeled_dt._address == 3
         assert labeled_dt.translate("123") == "123"
 
+    def test_reapplying_label_and_address_returns_same_instance(
+        self, labeled_dt: Parser
+    ):
+        assert labeled_dt @ 3 is labeled_dt
+        assert labeled_dt >> "label" is labeled_dt
+        assert labeled_dt @ 4 is not labeled_dt
+
     def test_default_parser_performs_no_op(self, labeled_dt: Parser, context: Context):
         with DataManager(b"123567") as data:
             labeled_dt.read(data, (context,))
 
         assert context == {}
 
-    def test_goto_addr_and_read_raises_error_past_required_address(
-        self, labeled_dt: Parser, context: Context
+    @pytest.mark.parametrize(
+        "bytes_read,expected",
+        [(5, IndexError), (3, {}), (1, {"spacer_0x1-0x2": b"23"})],
+        ids=["past_address", "at_address", "before_address"],
+    )
+    def test_goto_addr_and_read_spaces_to_required_address(
+        self,
+        labeled_dt: Parser,
+        context: Context,
+        bytes_read: int,
+        expected: dict[str, bytes] | type[Exception],
     ):
         with DataManager(b"123567") as data:
-            data.read(5)
-            with pytest.raises(IndexError):
+            data.read(bytes_read)
+            if isinstance(expected, dict):
                 labeled_dt.goto_addr_and_read(data, (context,))
+                assert context == expected
+            else:
+                with pytest.raises(expected):
+                    labeled_dt.goto_addr_and_read(data, (context,))
 
-    def test_goto_addr_and_read_does_not_create_spacer_if_at_address(
-        self, labeled_dt: Parser, context: Context
-    ):
-        with DataManager(b"123567") as data:
-            data.read(3)
-            labeled_dt.goto_addr_and_read(data, (context,))
-            assert not bool(context)
 
-    def test_goto_addr_and_read_creates_spacer_if_before_required_address(
-        self, labeled_dt: Parser, context: Context
-    ):
-        with DataManager(b"123567") as data:
-            data.read(1)
-            labeled_dt.goto_addr_and_read(data, (context,))
+class MockType(Parser):
+    __slots__ = ("value", "length")
+    _default_backup_label = "mock"
 
-            assert context["spacer_0x1-0x2"] == b"23"
+    def __init__(self, length: int | None = None, value: Any = None) -> None:
+        self.value = value
+        self.length = length
+        super().__init__()
 
+    def read(self, data: DataManager, contexts: Contexts):
+        data.read(self.length)
+        return self.value
 
-class TestSection:
-    class MockType(Parser):
-        _default_backup_label = "mock"
 
-        def __init__(self, length: int | None = None, value: Any = None) -> None:
-            self.value = value
-            self.length = length
-            super().__init__()
+NESTED_INPUT = bytes(range(256))
+spacer_data = NESTED_INPUT[:128]
+
+SEQUENTIAL_RESULT = {"mock_0x0": "foo", "mock_0x3": "bar", "mock_0x8": "baz"}
+
+
+def addressed_result(spacer: bytes, suffix: str = "") -> dict[str, Any]:
+    return {
+        f"{key}{suffix}": value
+        for key, value in {
+            **SEQUENTIAL_RESULT,
+            "spacer_0x9": spacer,
+            "mock_0xa": "qux",
+        }.items()
+    }
+
+
+NESTED_RESULT = {
+    **addressed_result(NESTED_INPUT[0x09:0x0A]),
+    "label": addressed_result(NESTED_INPUT[0x15:0x16]),
+    "spacer_0x18-0x27": NESTED_INPUT[0x18:0x28],
+    "label 1": addressed_result(NESTED_INPUT[0x31:0x32]),
+    "spacer_0x34-0x3b": NESTED_INPUT[0x34:0x3C],
+    **addressed_result(NESTED_INPUT[0x45:0x46], " 1"),
+}
+
+
+@pytest.fixture(scope="module")
+def empty_section() -> Section:
+    return Section()
+
+
+@pytest.fixture(scope="module")
+def sequential_section() -> Section:
+    return Section(
+        MockType(3, "foo"),
+        MockType(5, "bar"),
+        MockType(1, "baz"),
+    )
+
+
+@pytest.fixture(scope="module")
+def bitwise_sequential_section() -> Section:
+    return Section(
+        MockType(3, "foo"),
+        MockType(4, "bar"),
+        MockType(1, "baz"),
+        addr_type="BIT",
+    )
+
+
+@pytest.fixture(scope="module")
+def bitwise_sequential_section_length_9() -> Section:
+    return Section(
+        Section(
+            MockType(3, "foo"),
+            MockType(5, "bar"),
+            MockType(1, "baz"),
+            addr_type="BIT",
+        )
+    )
+
 
-        def read(self, data: DataManager, contexts: Contexts):
-            data.read(self.length)
-            return self.value
+@pytest.fixture(scope="module")
+def addressed_section() -> Section:
+    return Section(
+        MockType(3, "foo"),
+        MockType(5, "bar"),
+        MockType(1, "baz"),
+        MockType(2, "qux") @ 10,
+    )
 
-    @pytest.fixture
-    def empty_section(self) -> Section:
-        return Section()
 
+@pytest.fixture(scope="module")
+def addressed_block() -> Block:
+    return Block(
+        MockType(3, "foo"),
+        MockType(5, "bar"),
+        MockType(1, "baz"),
+        MockType(2, "qux") @ 10,
+    )
+
+
+class TestSection:
     def test_empty_block_returns_empty_dict_on_parsing(self, empty_section: Section):
         assert empty_section.parse(b"abc") == {}
 
@@ -156,23 +319,11 @@ class TestSection:
         with pytest.raises(TypeError):
             Section(addr_type={})  # type: ignore
 
-    @pytest.fixture
-    def sequential_section(self) -> Section:
-        return Section(
-            TestSection.MockType(3, "foo"),
-            TestSection.MockType(5, "bar"),
-            TestSection.MockType(1, "baz"),
-        )
-
     def test_block_returns_parsing_results_from_all_elements(
         self, sequential_section: Section
     ):
         result = sequential_section.parse(b"12354234562")
-        assert result == {
-            "mock_0x0": "foo",
-            "mock_0x3": "bar",
-            "mock_0x8": "baz",
-        }
+        assert result == SEQUENTIAL_RESULT
 
     def test_bytewise_block_raises_error_with_bits(self, sequential_section: Section):
         with pytest.raises(NotImplementedError):
@@ -185,15 +336,6 @@ class TestSection:
         with pytest.raises(FBNoDataError):
             sequential_section.parse(b"12")
 
-    @pytest.fixture
-    def bitwise_sequential_section(self) -> Section:
-        return Section(
-            TestSection.MockType(3, "foo"),
-            TestSection.MockType(4, "bar"),
-            TestSection.MockType(1, "baz"),
-            addr_type="BIT",
-        )
-
     def test_bitwise_block_works_on_bytewise_data(
         self, bitwise_sequential_section: Section
     ):
@@ -204,191 +346,78 @@ class TestSection:
             "mock_0x7": "baz",
         }
 
-    @pytest.fixture
-    def bitwise_sequential_section_length_9(self) -> Section:
-
-        return Section(
-            Section(
-                TestSection.MockType(3, "foo"),
-                TestSection.MockType(5, "bar"),
-                TestSection.MockType(1, "baz"),
-                addr_type="BIT",
-            )
-        )
-
     def test_bitwise_block_parsing_bytewise_data_ending_off_byte_boundary_raises_error(
         self, bitwise_sequential_section_length_9: Section
     ):
-        with pytest.raises(RuntimeError):
+        with pytest.raises(RuntimeError, match="non-byte length"):
             bitwise_sequential_section_length_9.parse(b"12354234562")
 
-    @pytest.fixture
-    def addressed_section(self) -> Section:
-        return Section(
-            TestSection.MockType(3, "foo"),
-            TestSection.MockType(5, "bar"),
-            TestSection.MockType(1, "baz"),
-            TestSection.MockType(2, "qux") @ 10,
-        )
-
-    @pytest.fixture
-    def addressed_block(self) -> Block:
-        return Block(
-            TestSection.MockType(3, "foo"),
-            TestSection.MockType(5, "bar"),
-            TestSection.MockType(1, "baz"),
-            TestSection.MockType(2, "qux") @ 10,
-        )
-
     def test_section_gets_spacer_with_addressed_elements(
         self, addressed_section: Section
     ):
 
         result = addressed_section.parse(b"\0" * 100)
 
-        assert result == {
-            "mock_0x0": "foo",
-            "mock_0x3": "bar",
-            "mock_0x8": "baz",
-            "spacer_0x9": b"\x00",
-            "mock_0xa": "qux",
-        }
+        assert result == addressed_result(b"\x00")
 
+    @pytest.mark.parametrize(
+        "with_failed_optional", [False, True], ids=["plain", "failed_optional"]
+    )
     def test_nested_blocks_produce_expected_results(
-        self, addressed_section: Section, addressed_block: Block
+        self,
+        addressed_section: Section,
+        addressed_block: Block,
+        with_failed_optional: bool,
     ):
-        cnk = Section(
-            addressed_section,
-            addressed_block >> "label",
-            addressed_block @ 40 >> "label",
-            addressed_section @ 60,
-        )
-
-        result = cnk.parse(bytes(range(256)))
-        print(result)
-
-        assert result == {
-            "mock_0x0": "foo",
-            "mock_0x3": "bar",
-            "mock_0x8": "baz",
-            "spacer_0x9": b"\t",
-            "mock_0xa": "qux",
-            "label": {
-                "mock_0x0": "foo",
-                "mock_0x3": "bar",
-                "mock_0x8": "baz",
-                "spacer_0x9": b"\x15",
-                "mock_0xa": "qux",
-            },
-            "spacer_0x18-0x27": b"\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !\"#$%&'",
-            "label 1": {
-                "mock_0x0": "foo",
-                "mock_0x3": "bar",
-                "mock_0x8": "baz",
-                "spacer_0x9": b"1",
-                "mock_0xa": "qux",
-            },
-            "spacer_0x34-0x3b": b"456789:;",
-            "mock_0x0 1": "foo",
-            "mock_0x3 1": "bar",
-            "mock_0x8 1": "baz",
-            "spacer_0x9 1": b"E",
-            "mock_0xa 1": "qux",
-        }
-
-    def test_optional_blocks_work(
-        self, addressed_section: Section, addressed_block: Block
-    ):
-        cnk = Section(
-            addressed_section,
-            Optional(
-                addressed_block >> "opt",
-                addressed_block @ 40 >> "opt",
-                Block(
-                    addressed_section @ 60,
-                    Failure,
+        elements: list[Parser] = [addressed_section]
+        if with_failed_optional:
+            # A failing Optional must leave no trace in the results
+            elements.append(
+                Optional(
+                    addressed_block >> "opt",
+                    addressed_block @ 40 >> "opt",
+                    Block(
+                        addressed_section @ 60,
+                        Failure,
+                        relative=False,
+                    ),
                     relative=False,
-                ),
-                relative=False,
-            ),
+                )
+            )
+        elements += [
             addressed_block >> "label",
             addressed_block @ 40 >> "label",
             addressed_section @ 60,
-        )
-        result = cnk.parse(bytes(range(256)))
-
-        assert result == {
-            "mock_0x0": "foo",
-            "mock_0x3": "bar",
-            "mock_0x8": "baz",
-            "spacer_0x9": b"\t",
-            "mock_0xa": "qux",
-            "label": {
-                "mock_0x0": "foo",
-                "mock_0x3": "bar",
-                "mock_0x8": "baz",
-                "spacer_0x9": b"\x15",
-                "mock_0xa": "qux",
-            },
-            "spacer_0x18-0x27": b"\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f !\"#$%&'",
-            "label 1": {
-                "mock_0x0": "foo",
-                "mock_0x3": "bar",
-                "mock_0x8": "baz",
-                "spacer_0x9": b"1",
-                "mock_0xa": "qux",
-            },
-            "spacer_0x34-0x3b": b"456789:;",
-            "mock_0x0 1": "foo",
-            "mock_0x3 1": "bar",
-            "mock_0x8 1": "baz",
-            "spacer_0x9 1": b"E",
-            "mock_0xa 1": "qux",
-        }
-
-
-@pytest.fixture
-def spacer_stream_data():
-    dat = bytes(range(128))
-    return DataManager(io.BytesIO(dat))
+        ]
+        cnk = Section(*elements)
 
+        result = cnk.parse(NESTED_INPUT)
 
-@pytest.fixture
-def spacer_bytes_data():
-    dat = bytes(range(256)) * 16
-    return DataManager(dat)
-
-
-spacer_data = bytes(range(128))
+        assert result == NESTED_RESULT
 
 
 class TestSpacer:
-
-    @pytest.fixture
-    def context(self):
-        return Context()
-
     def test_spacer_generates_expected_dictionary_and_return_value(
         self, context: Context
     ):
         with DataManager(spacer_data) as data:
             data.read(1)
             _spacer(data, context, 6)
-            assert context["spacer_0x1-0x5"] == bytes(spacer_data[1:6])
+            assert context["spacer_0x1-0x5"] == spacer_data[1:6]
 
     def test_duplicate_spacer_generates_expected_dictionary_and_return_value(
         self, context: Context
     ):
         with DataManager(spacer_data) as data:
-            context["spacer_0x1-0x5"] = bytes(spacer_data[1:6])
+            context["spacer_0x1-0x5"] = spacer_data[1:6]
             data.read(1)
             _spacer(data, context, 6)
-            assert context["spacer_0x1-0x5 1"] == bytes(spacer_data[1:6])
+            assert context["spacer_0x1-0x5 1"] == spacer_data[1:6]
 
     def test_spacer_works_with_entire_input(self, context: Context):
         with DataManager(spacer_data) as data:
             _spacer(data, context, 128)
-            assert context["spacer_0x0-0x7f"] == bytes(spacer_data)
+            assert context["spacer_0x0-0x7f"] == spacer_data
 
     def test_length_one_beyond_input_size_raises_error(self, context: Context):
         with DataManager(spacer_data) as data:
@@ -404,3 +433,8 @@ class TestSpacer:
         with DataManager(spacer_data) as data:
             _spacer(data, context, 0)
             assert context == {}
+
+
+def test_hex_matches_builtin():
+    for addr in (0, 1, 255, 4095, 4096, 100000):
+        assert _hex(addr) == hex(addr)
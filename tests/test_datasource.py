@@ -4,7 +4,9 @@
 # pylint: disable=protected-access
 # pyright: reportPrivateUsage=false
 
+import re
 from io import BytesIO
+from typing import Any, Callable
 import pytest
 from formatbreaker.datasource import (
     DataManager,
@@ -16,7 +18,40 @@ from formatbreaker.datasource import (
 from formatbreaker.bitwisebytes import BitwiseBytes
 from formatbreaker.exceptions import FBError, FBNoDataError
 
-src_data = bytes(range(256)) * 24
+HAS_CHILD = re.compile("with a child")
+OUTSIDE_WITH = re.compile("outside a with statement")
+
+# Every DataManager operation that must fail while the instance is unsafe to use
+UNSAFE_OPERATIONS = pytest.mark.parametrize(
+    "operation",
+    [
+        lambda data: data.make_child(),
+        lambda data: data.read(1),
+        lambda data: data.read_bits(1),
+        lambda data: data.read_bytes(1),
+        lambda data: data.address,
+        lambda data: data._trim(),
+    ],
+    ids=["make_child", "read", "read_bits", "read_bytes", "address", "trim"],
+)
+
+src_data = bytes(range(256)) * (DATA_BUFFER_SIZE * 3 // 1024)  # Six buffers of data
+
+# The three reads made by the basic reading tests
+EXPECTED_BITS = (
+    BitwiseBytes(src_data, 0, 1025),
+    BitwiseBytes(src_data, 1025, 2050),
+    BitwiseBytes(src_data, 2050),
+)
+EXPECTED_BYTES = (src_data[0:1025], src_data[1025:2050], src_data[2050:])
+
+
+@pytest.fixture(params=["bytes", "stream"])
+def src(request: pytest.FixtureRequest) -> bytes | BytesIO:
+    if request.param == "bytes":
+        return src_data
+    # A fresh stream for each test. BytesIO shares the bytes rather than copying them.
+    return BytesIO(src_data)
 
 
 class TestDataBuffer:
@@ -46,6 +81,21 @@ class TestDataBuffer:
         with pytest.raises(FBNoDataError):
             data.get_data(0, e_addr + 1)
 
+    def test_aligned_bytes_reading(self, src: BytesIO):
+        data = DataBuffer(src)
+
+        b, b_addr = data.get_bytes(8, DATA_BUFFER_SIZE + 8)
+        c, c_addr = data.get_bytes(b_addr, 2 * DATA_BUFFER_SIZE)
+        d, d_addr = data.get_bytes(c_addr)
+
+        assert b == src_data[1 : DATA_BUFFER_SIZE // 8 + 2]
+        assert c == src_data[DATA_BUFFER_SIZE // 8 + 2 : 3 * DATA_BUFFER_SIZE // 8 + 2]
+        assert d == src_data[3 * DATA_BUFFER_SIZE // 8 + 2 :]
+        assert d_addr == bitlen(src_data)
+
+        with pytest.raises(FBNoDataError):
+            data.get_bytes(d_addr, 8)
+
     def test_stream_reading_and_trimming(self):
         data = DataBuffer(BytesIO(src_data))
         assert data.lower_bound == 0
@@ -99,16 +149,15 @@ class TestDataBuffer:
         with pytest.raises(FBNoDataError):
             data.get_data(e_addr, 1)
 
-        with pytest.raises(IndexError):
+        with pytest.raises(IndexError, match="no longer in DataBuffer"):
             data.get_data(0, 1)
 
-        with pytest.raises(IndexError):
+        with pytest.raises(IndexError, match="no longer in DataBuffer"):
             data.get_data(4 * DATA_BUFFER_SIZE - 1, 1)
 
 
 class TestDataManager:
 
-    @pytest.mark.parametrize("src", [src_data, BytesIO(src_data)])
     def test_basic_bit_reading(self, src: BytesIO):
         with DataManager(src) as data:
 
@@ -116,11 +165,8 @@ class TestDataManager:
             c = data.read_bits(1025)
             d = data.read_bits()
 
-        assert b == BitwiseBytes(src_data, 0, 1025)
-        assert c == BitwiseBytes(src_data, 1025, 2050)
-        assert d == BitwiseBytes(src_data, 2050)
+        assert (b, c, d) == EXPECTED_BITS
 
-    @pytest.mark.parametrize("src", [src_data, BytesIO(src_data)])
     def test_basic_byte_reading(self, src: BytesIO):
         with DataManager(src) as data:
 
@@ -128,11 +174,8 @@ class TestDataManager:
             c = data.read_bytes(1025)
             d = data.read_bytes()
 
-        assert b == src_data[0:1025]
-        assert c == src_data[1025:2050]
-        assert d == src_data[2050:]
+        assert (b, c, d) == EXPECTED_BYTES
 
-    @pytest.mark.parametrize("src", [src_data, BytesIO(src_data)])
     def test_zero_length_reads(self, src: BytesIO):
         with DataManager(src) as data:
 
@@ -142,7 +185,6 @@ class TestDataManager:
         assert b == b""
         assert c == BitwiseBytes(b"")
 
-    @pytest.mark.parametrize("src", [src_data, BytesIO(src_data)])
     def test_read_bytes_at_eof_raises_exception(self, src: BytesIO):
         with DataManager(src) as data:
 
@@ -151,7 +193,6 @@ class TestDataManager:
             with pytest.raises(FBNoDataError):
                 _ = data.read_bytes(1)
 
-    @pytest.mark.parametrize("src", [src_data, BytesIO(src_data)])
     def test_read_bits_at_eof_raises_exception(self, src: BytesIO):
         with DataManager(src) as data:
 
@@ -160,14 +201,12 @@ class TestDataManager:
             with pytest.raises(FBNoDataError):
                 _ = data.read_bits(1)
 
-    @pytest.mark.parametrize("src", [src_data, BytesIO(src_data)])
     def test_read_bytes_past_eof_raises_exception(self, src: BytesIO):
         with DataManager(src) as data:
 
             with pytest.raises(FBNoDataError):
                 _ = data.read_bytes(len(src_data) + 1)
 
-    @pytest.mark.parametrize("src", [src_data, BytesIO(src_data)])
     def test_read_bits_past_eof_raises_exception(self, src: BytesIO):
         with DataManager(src) as data:
 
@@ -270,42 +309,39 @@ class TestDataManager:
                 _ = child1.read_bits(bitlen(src_data) + 1)
             assert data._cursor == 0
 
-    def test_incorrect_child_management_raises_error(self):
+    @UNSAFE_OPERATIONS
+    def test_parent_with_child_raises_error(
+        self, operation: Callable[[DataManager], Any]
+    ):
         with DataManager(BytesIO(src_data)) as data:
             with data.make_child() as child1:
                 child1.read(1)
-                with pytest.raises(RuntimeError):
-                    with data.make_child() as _:
-                        pass
-                with pytest.raises(RuntimeError):
-                    _ = data.read(1)
-                with pytest.raises(RuntimeError):
-                    _ = data.read_bits(1)
-                with pytest.raises(RuntimeError):
-                    _ = data.read_bytes(1)
-                with pytest.raises(RuntimeError):
-                    _ = data.address
-                with pytest.raises(RuntimeError):
-                    data._trim()
+                with pytest.raises(RuntimeError, match=HAS_CHILD):
+                    operation(data)
 
+    @UNSAFE_OPERATIONS
+    def test_use_outside_with_raises_error(
+        self, operation: Callable[[DataManager], Any]
+    ):
         data = DataManager(BytesIO(src_data))
-        with pytest.raises(RuntimeError):
-            with data.make_child() as _:
-                pass
-        with pytest.raises(RuntimeError):
-            _ = data.read(1)
-        with pytest.raises(RuntimeError):
-            _ = data.read_bits(1)
-        with pytest.raises(RuntimeError):
-            _ = data.read_bytes(1)
-        with pytest.raises(RuntimeError):
-            _ = data.address
-        with pytest.raises(RuntimeError):
-            data._trim()
+        with pytest.raises(RuntimeError, match=OUTSIDE_WITH):
+            operation(data)
 
     def test_strict_must_start_on_byte(self):
         with DataManager(BytesIO(src_data)) as data:
             _ = data.read_bits(1)
-            with pytest.raises(FBError):
+            with pytest.raises(FBError, match="byte boundary"):
                 with data.make_child(addr_type=AddrType.BYTE_STRICT) as _:
                     pass
+
+    def test_aligned_and_unaligned_byte_reads_match(self, src: BytesIO):
+        with DataManager(src) as data:
+            b = data.read_bytes(3)
+            _ = data.read_bits(4)
+            c = data.read_bytes(3)
+            _ = data.read_bits(4)
+            d = data.read_bytes()
+
+        assert b == src_data[0:3]
+        assert c == bytes(BitwiseBytes(src_data, 28, 52))
+        assert d == src_data[7:]
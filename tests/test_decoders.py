@@ -7,31 +7,54 @@ import struct
 import uuid
 import pytest
 import formatbreaker.decoders as fd
+from formatbreaker.core import Parser, Context
+from formatbreaker.datasource import DataManager
 from formatbreaker.exceptions import FBError
 
+BYTE_VALUES = bytes(range(256))
+
+# Packed once at import rather than inside each test
+PACKED = {
+    "int32l": struct.pack("<i", -76),
+    "int16l": struct.pack("<h", -76),
+    "int8": struct.pack("b", -76),
+    "uint32l": struct.pack("<I", 1244354),
+    "uint16l": struct.pack("<H", 12552),
+    "uint8": struct.pack("B", 129),
+    "float32l": struct.pack("<f", 123.4),
+    "float64l": struct.pack("<d", 123.4),
+}
+
 
 def test_byte_flag():
     par = fd.ByteFlag()
     assert not par.parse(b"\0")["Flag_0x0"]
-    for val in range(1, 256):
-        assert par.parse(bytes([val]))["Flag_0x0"]
+    # Reads every nonzero byte in a single parse
+    assert par[255].parse(BYTE_VALUES[1:])["Flag_0x0"] == [True] * 255
 
     par = fd.ByteFlag(b"\x01")
     assert not par.parse(b"\0")["Flag_0x0"]
-    assert par.parse(bytes([1]))["Flag_0x0"]
-    for val in range(2, 256):
-        with pytest.raises(FBError):
-            _ = par.parse(bytes([val]))
+    assert par.parse(b"\x01")["Flag_0x0"]
+    # Reads the rejected values one after another from a single DataManager
+    contexts = (Context(),)
+    with DataManager(BYTE_VALUES[2:]) as data:
+        for val in range(2, 256):
+            try:
+                _ = par.read_and_translate(data, contexts)
+            except FBError:
+                continue
+            pytest.fail(f"FBError not raised for {val:#x}")
+        assert data.address == 254
 
 
 def test_bit_const():
     par = fd.BitOne
     assert par.parse(b"\x80")["Const_0x0"]
-    with pytest.raises(FBError):
+    with pytest.raises(FBError, match="Constant not matched"):
         _ = par.parse(b"\x00")
     par = fd.BitZero
     assert not par.parse(b"\x00")["Const_0x0"]
-    with pytest.raises(FBError):
+    with pytest.raises(FBError, match="Constant not matched"):
         _ = par.parse(b"\x80")
 
 
@@ -56,47 +79,31 @@ def test_bit_flags():
     ]
 
 
-def test_int32l():
-    par = fd.Int32L
-    result = par.parse(struct.pack("<i", -76))
-    print(result)
-    assert result["Int32_0x0"] == -76
-
-
-def test_int16l():
-    par = fd.Int16L
-    assert par.parse(struct.pack("<h", -76))["Int16_0x0"] == -76
-
-
-def test_int8l():
-    par = fd.Int8
-    assert par.parse(struct.pack("b", -76))["Int8_0x0"] == -76
-
-
-def test_uint32l():
-    par = fd.UInt32L
-    assert par.parse(struct.pack("<I", 1244354))["UInt32_0x0"] == 1244354
-
-
-def test_uint16l():
-    par = fd.UInt16L
-    assert par.parse(struct.pack("<H", 12552))["UInt16_0x0"] == 12552
-
-
-def test_uint8():
-    par = fd.UInt8
-    assert par.parse(struct.pack("B", 129))["UInt8_0x0"] == 129
+@pytest.mark.parametrize(
+    "par,label,key,value",
+    [
+        (fd.Int32L, "Int32_0x0", "int32l", -76),
+        (fd.Int16L, "Int16_0x0", "int16l", -76),
+        (fd.Int8, "Int8_0x0", "int8", -76),
+        (fd.UInt32L, "UInt32_0x0", "uint32l", 1244354),
+        (fd.UInt16L, "UInt16_0x0", "uint16l", 12552),
+        (fd.UInt8, "UInt8_0x0", "uint8", 129),
+    ],
+    ids=["int32l", "int16l", "int8l", "uint32l", "uint16l", "uint8"],
+)
+def test_int_parsers(par: Parser, label: str, key: str, value: int):
+    assert par.parse(PACKED[key])[label] == value
 
 
 def test_float32l():
-    dat = struct.pack("<f", 123.4)
+    dat = PACKED["float32l"]
     num = struct.unpack("<f", dat)[0]
     par = fd.Float32L
     assert par.parse(dat)["Float32_0x0"] == num
 
 
 def test_float64l():
-    dat = struct.pack("<d", 123.4)
+    dat = PACKED["float64l"]
     num = struct.unpack("<d", dat)[0]
     par = fd.Float64L
     assert par.parse(dat)["Float64_0x0"] == num